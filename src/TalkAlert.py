@@ -2,6 +2,8 @@
 Deps:
   pip install discord.py ttkbootstrap pygame-ce
   (pygame-ce provides 'import pygame' and works on Python 3.14)
+  Optional: pip install orjson requests
+    (orjson: faster config load/save; requests: keep-alive Pushover connection)
 
 Build (PyInstaller):
   py -3.14 -m PyInstaller --noconfirm --clean --onefile --windowed --name TalkAlert --icon TalkAlert.ico ^
@@ -11,14 +13,17 @@ Build (PyInstaller):
 from __future__ import annotations
 
 import asyncio
+import functools
+import http.client
 import json
 import os
+import queue
 import sys
 import threading
 import time
 import urllib.parse
-import urllib.request
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Optional
 
@@ -31,68 +36,95 @@ from ttkbootstrap.constants import *
 
 
 APP_NAME = "TalkAlert"
-FORCE_EXIT = True  # close app -> ensure process exits
 
 CONFIG_DIR = Path(os.environ.get("APPDATA", str(Path.home()))) / APP_NAME
 CONFIG_PATH = CONFIG_DIR / "config.json"
+CONFIG_SAVE_DELAY_MS = 300  # debounce for config writes
 
 ALLOWED_AUDIO = (".wav", ".mp3")
+_AUDIO_EXT = frozenset(ALLOWED_AUDIO)
+AUDIO_BUFFER_DEFAULT = 512  # mixer buffer (samples, ~12ms at 44.1kHz); config "audio_buffer" overrides
+AUDIO_BUFFER_RANGE = (256, 4096)  # below underruns on most devices; above ~90ms of alert delay
+AUDIO_ERROR_INTERVAL_S = 60.0  # alert-triggered playback errors show at most one dialog per interval
+ALERT_CHANNELS = 4  # reserved mixer channels, so alerts from different users can overlap
+SOUND_STREAM_MIN_BYTES = 1_000_000  # WAVs this large stream via mixer.music instead of a decoded Sound
+SOUND_STREAM_MIN_BYTES_MP3 = 256_000  # same for MP3 (~16s at 128kbps; decodes to roughly 10x its size)
 
 PUSHOVER_API_URL = "https://api.pushover.net/1/messages.json"
+PUSHOVER_QUEUE_MAX = 256  # pending pushes; newer ones are dropped beyond this
+_PUSHOVER_URL_PARTS = urllib.parse.urlsplit(PUSHOVER_API_URL)
+_quote_stable = functools.lru_cache(maxsize=64)(urllib.parse.quote_plus)  # low-cardinality form values
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+# Fully-qualified ttk style for the form's caption labels (same as bootstyle="secondary"; skips
+# ttkbootstrap's per-widget bootstyle parsing once the style exists).
+STYLE_CAPTION = "secondary.TLabel"
+
+# One context menu shared by every Entry/Text; _EDIT_MENU_TARGET is the widget it was opened on.
+_EDIT_MENU: Optional[tk.Menu] = None
+_EDIT_MENU_TARGET: Optional[tk.Widget] = None
+
+
+def _edit_menu_generate(sequence: str):
+    widget = _EDIT_MENU_TARGET
+    if widget is None:
+        return
+    try:
+        widget.event_generate(sequence)
+    except Exception:
+        pass
+
+
+def _edit_menu_select_all():
+    widget = _EDIT_MENU_TARGET
+    if widget is None:
+        return
+    try:
+        widget.focus_set()
+    except Exception:
+        pass
+    # Entry-like
+    try:
+        widget.selection_range(0, tk.END)  # type: ignore[attr-defined]
+        widget.icursor(tk.END)  # type: ignore[attr-defined]
+        return
+    except Exception:
+        pass
+    # Text-like
+    try:
+        widget.tag_add("sel", "1.0", "end-1c")  # type: ignore[attr-defined]
+        widget.mark_set("insert", "end-1c")  # type: ignore[attr-defined]
+    except Exception:
+        pass
+
+
+def _get_edit_menu(widget: tk.Widget) -> tk.Menu:
+    """Build the shared edit menu on first use (parented to the Tk root so dialogs can close freely)."""
+    global _EDIT_MENU
+    if _EDIT_MENU is None:
+        menu = tk.Menu(widget._root(), tearoff=0)
+        menu.add_command(label="切り取り", command=lambda: _edit_menu_generate("<<Cut>>"))
+        menu.add_command(label="コピー", command=lambda: _edit_menu_generate("<<Copy>>"))
+        menu.add_command(label="貼り付け", command=lambda: _edit_menu_generate("<<Paste>>"))
+        menu.add_separator()
+        menu.add_command(label="全選択", command=_edit_menu_select_all)
+        _EDIT_MENU = menu
+    return _EDIT_MENU
 
-def bind_edit_context_menu(widget: tk.Widget):
-    """Attach a right-click context menu (Cut/Copy/Paste/Select All) to Entry/Text widgets."""
-    menu = tk.Menu(widget, tearoff=0)
-
-    def _cut():
-        try:
-            widget.event_generate("<<Cut>>")
-        except Exception:
-            pass
-
-    def _copy():
-        try:
-            widget.event_generate("<<Copy>>")
-        except Exception:
-            pass
-
-    def _paste():
-        try:
-            widget.event_generate("<<Paste>>")
-        except Exception:
-            pass
-
-    def _select_all():
-        try:
-            widget.focus_set()
-        except Exception:
-            pass
-        # Entry-like
-        try:
-            widget.selection_range(0, tk.END)  # type: ignore[attr-defined]
-            widget.icursor(tk.END)  # type: ignore[attr-defined]
-            return
-        except Exception:
-            pass
-        # Text-like
-        try:
-            widget.tag_add("sel", "1.0", "end-1c")  # type: ignore[attr-defined]
-            widget.mark_set("insert", "end-1c")  # type: ignore[attr-defined]
-        except Exception:
-            pass
 
-    menu.add_command(label="切り取り", command=_cut)
-    menu.add_command(label="コピー", command=_copy)
-    menu.add_command(label="貼り付け", command=_paste)
-    menu.add_separator()
-    menu.add_command(label="全選択", command=_select_all)
+def bind_edit_context_menu(widget: tk.Widget):
+    """Attach the right-click context menu (Cut/Copy/Paste/Select All) to Entry/Text widgets."""
 
     def _popup(event):
+        global _EDIT_MENU_TARGET
         try:
             widget.focus_set()
         except Exception:
             pass
 
+        menu = _get_edit_menu(widget)
+        _EDIT_MENU_TARGET = widget
+
         # Enable/disable Cut/Copy based on selection (best-effort)
         has_sel = False
         try:
@@ -120,39 +152,121 @@ def bind_edit_context_menu(widget: tk.Widget):
     # macOS Ctrl+Click fallback
     widget.bind("<Control-Button-1>", _popup, add="+")
 
-def resource_path(rel: str) -> Path:
+
+def _validate_sound(path: str) -> bool:
+    """True if path is non-empty and has an allowed audio extension (case-insensitive)."""
+    return bool(path) and os.path.splitext(path)[1].lower() in _AUDIO_EXT
+
+
+def _normalize_sound_path(path: str) -> str:
+    """Absolute, normalized form stored on a rule (one sound-cache entry per file, whatever was typed)."""
+    return os.path.abspath(os.path.expanduser(path))
+
+
+def _parse_user_id(user_id: str) -> int:
+    """Discord user ID as int, 0 if it isn't one. isdecimal(), not isdigit(): '²' is a digit int() rejects."""
+    return int(user_id) if user_id.isdecimal() else 0
+
+
+@functools.lru_cache(maxsize=16)
+def resource_path(rel: str) -> str:
     """Return absolute path to a resource (works for PyInstaller onefile)."""
-    base = Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parent))
-    return base / rel
+    base = getattr(sys, "_MEIPASS", None) or os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(base, rel)
 
 
 # Optional deps
-try:
-    import pygame  # pygame-ce works as 'pygame'
-    _HAS_PYGAME = True
-except Exception:
-    pygame = None
-    _HAS_PYGAME = False
+# pygame / discord / pystray+PIL are heavy, so they are imported on first use via _load_*().
+# _HAS_* is None until the import has been attempted.
+pygame = None
+_HAS_PYGAME: Optional[bool] = None
 
-try:
-    import discord
-    _HAS_DISCORD = True
-except Exception:
-    discord = None
-    _HAS_DISCORD = False
+discord = None
+_HAS_DISCORD: Optional[bool] = None
+
+pystray = None
+Image = None
+ImageDraw = None
+_HAS_TRAY: Optional[bool] = None
+
+requests = None
+_HAS_REQUESTS: Optional[bool] = None
+
+
+def _load_pygame() -> bool:
+    global pygame, _HAS_PYGAME
+    if _HAS_PYGAME is None:
+        try:
+            import pygame as _pygame  # pygame-ce works as 'pygame'
+            pygame = _pygame
+            _HAS_PYGAME = True
+        except Exception:
+            _HAS_PYGAME = False
+    return _HAS_PYGAME
+
+
+def _load_discord() -> bool:
+    global discord, _HAS_DISCORD
+    if _HAS_DISCORD is None:
+        try:
+            import discord as _discord
+            discord = _discord
+            _HAS_DISCORD = True
+        except Exception:
+            _HAS_DISCORD = False
+    return _HAS_DISCORD
+
+
+def _load_requests() -> bool:
+    # optional: keep-alive connection pool for Pushover (heavy import; only needed on the first push)
+    global requests, _HAS_REQUESTS
+    if _HAS_REQUESTS is None:
+        try:
+            import requests as _requests
+            requests = _requests
+            _HAS_REQUESTS = True
+        except Exception:
+            _HAS_REQUESTS = False
+    return _HAS_REQUESTS
+
+
+def _load_tray() -> bool:
+    global pystray, Image, ImageDraw, _HAS_TRAY
+    if _HAS_TRAY is None:
+        try:
+            import pystray as _pystray
+            from PIL import Image as _Image, ImageDraw as _ImageDraw
+            pystray, Image, ImageDraw = _pystray, _Image, _ImageDraw
+            _HAS_TRAY = True
+        except Exception:
+            _HAS_TRAY = False
+    return _HAS_TRAY
 
 try:
-    import pystray
-    from PIL import Image, ImageDraw
-    _HAS_TRAY = True
+    import orjson  # optional: faster config load/save
+    _HAS_ORJSON = True
 except Exception:
-    pystray = None
-    Image = None
-    ImageDraw = None
-    _HAS_TRAY = False
+    orjson = None
+    _HAS_ORJSON = False
+
+
+
+def _json_loads(raw: bytes):
+    if raw[:3] == b"\xef\xbb\xbf":
+        raw = raw[3:]  # UTF-8 BOM (config hand-edited in Notepad); orjson rejects it
+    if _HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)  # bytes in: no intermediate decode
+
 
+def _json_dumps(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes (non-ASCII kept as-is)."""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
-@dataclass
+
+@dataclass(slots=True)
 class Rule:
     name: str
     user_id: str
@@ -160,12 +274,48 @@ class Rule:
     volume: int = 100  # 0-100
 
     pushover_sound: str = ""  # empty -> device default
+    _name_cf: str = field(init=False, default="", repr=False, compare=False)
+    _name_cf_of: Optional[str] = field(init=False, default=None, repr=False, compare=False)  # name it was derived from
+    _user_id_int: int = field(init=False, default=0, repr=False, compare=False)  # Discord author.id (0 = invalid)
+    _sound_filename: str = field(init=False, default="", repr=False, compare=False)
+    _sound_filename_of: Optional[str] = field(init=False, default=None, repr=False, compare=False)  # sound_path it was derived from
+    _as_dict: Optional[dict] = field(init=False, default=None, repr=False, compare=False)
+    _as_dict_of: Optional[tuple] = field(init=False, default=None, repr=False, compare=False)  # field values it was built from
+
+    def __post_init__(self):
+        self._user_id_int = _parse_user_id(self.user_id)
+        self._sound_filename = os.path.basename(self.sound_path)
+        self._sound_filename_of = self.sound_path
+
+    @property
+    def sort_key(self) -> str:
+        """Casefolded name for the Name sort; cached until name is reassigned."""
+        if self._name_cf_of != self.name:
+            self._name_cf = (self.name or "").casefold()
+            self._name_cf_of = self.name
+        return self._name_cf
+
     @property
     def sound_filename(self) -> str:
-        try:
-            return Path(self.sound_path).name
-        except Exception:
-            return self.sound_path
+        # cached; recomputed only when sound_path has been reassigned
+        if self._sound_filename_of != self.sound_path:
+            self._sound_filename = os.path.basename(self.sound_path)
+            self._sound_filename_of = self.sound_path
+        return self._sound_filename
+
+    def as_dict(self) -> dict:
+        """config.json form of this rule; the same dict is reused until a field changes (don't mutate it)."""
+        key = (self.name, self.user_id, self.sound_path, self.volume, self.pushover_sound)
+        if self._as_dict_of != key:
+            self._as_dict = {
+                "name": self.name,
+                "user_id": self.user_id,
+                "sound_path": self.sound_path,
+                "volume": self.volume,
+                "pushover_sound": self.pushover_sound,
+            }
+            self._as_dict_of = key
+        return self._as_dict
 
 
 class TalkAlertApp(tb.Window):
@@ -185,14 +335,36 @@ class TalkAlertApp(tb.Window):
         # runtime state
         self.stop_event = threading.Event()
         self._after_ids = set()
+        self._shutting_down = False  # set while the exit prompt is open / after it was confirmed
+        self._exit_dlg = None  # exit confirmation Toplevel (built on first use, then reused)
+        self._exit_var = None
+        self._exit_yes_btn = None
+        self._save_after_id = None  # pending debounced _write_config
+        self._last_config_bytes: Optional[bytes] = None  # last payload written to config.json
+        # config.json is written by a daemon thread so the Tk loop never waits on disk
+        self._cfg_queue: "queue.Queue" = queue.Queue(maxsize=1)  # latest payload only
+        self._cfg_lock = threading.Lock()  # serializes file writes (writer thread vs. exit)
+        self._cfg_seq = 0  # bumped per payload; stale payloads are not written
+        self._cfg_written_seq = 0
+        self._cfg_writer: Optional[threading.Thread] = None
+        self._refresh_pending = False
+        self._refresh_select: Optional[str] = None
+        self._tree_rows: dict = {}  # iid -> values currently shown in the tree
 
         self.rules: List[Rule] = []
+        self._rules_by_id: dict = {}  # user_id -> Rule (_find_rule)
+        self._rules_by_uid: dict = {}  # int(user_id) -> Rule (message dispatch)
         self.muted = False
+        self._muted_rendered = False  # mute state btn_mute currently shows (built as OFF)
         self.bot_token: str = ""  # loaded from config
         self.tray_on_minimize: bool = True  # minimize -> tray (default ON)
+        self.audio_buffer: int = AUDIO_BUFFER_DEFAULT  # raise if playback crackles on this PC
         self._in_tray = False
+        self._unmap_after_id = None  # pending minimize re-check (_on_unmap)
+        self._first_map_pending = True  # form + audio init wait for the window to be mapped (_on_map)
         self._tray_icon = None
         self._tray_thread = None
+        self._tray_image = None  # decoded once, reused across tray show/hide
 
         # pushover (iOS push)
         self.pushover_enabled: bool = False
@@ -200,20 +372,43 @@ class TalkAlertApp(tb.Window):
         self.pushover_app_token: str = ""
         self.pushover_push_when_muted: bool = True
         self.pushover_include_message: bool = True  # include message text in push
+        self._po_active: bool = False  # enabled and both keys set (see _recompute_po_active)
+        self._po_session = None  # None -> http.client fallback
+        self._po_session_checked = False  # session is created on the first push, off the Tk thread
+        self._po_conn: Optional[http.client.HTTPSConnection] = None  # kept-alive fallback connection
+        self._po_conn_lock = threading.Lock()
+        self._po_queue: queue.Queue = queue.Queue(maxsize=PUSHOVER_QUEUE_MAX)  # (title, message, url, sound) | None
+        self._po_worker: Optional[threading.Thread] = None
+        self._po_body_prefix: Optional[tuple] = None  # ((app_token, user_key), "token=...&user=...")
 
         # discord runtime
         self._discord_client = None
         self._discord_loop: Optional[asyncio.AbstractEventLoop] = None
         self._bot_thread: Optional[threading.Thread] = None
-        self._bot_thread_lock = threading.Lock()
+        self._bot_running_token: str = ""  # token the current client was started with
+        self._play_queue: "queue.SimpleQueue" = queue.SimpleQueue()  # rules to alert for (bot -> audio worker)
+        self._audio_worker: Optional[threading.Thread] = None  # started on the first queued alert
+        self._ui_queue: "queue.SimpleQueue" = queue.SimpleQueue()  # callables for the Tk thread (_ui_call)
+        self._ui_drain_pending = False
 
         # bot status UI
         self._bot_state = "offline"  # offline | connecting | online
         self._blink_on = True
-
-        # audio init
-        self._audio_ready = False
-        self._init_audio()
+        self._blink_after_id = None  # pending _tick_blink (None -> not blinking)
+
+        # audio (pygame + mixer are initialised once the window is mapped, see _on_map and _ensure_audio)
+        self._audio_ready: Optional[bool] = None  # None -> not initialised yet
+        self._sound_cache: dict = {}  # sound_path -> ("buf", pygame.mixer.Sound) | ("stream", path)
+        self._now_playing = None  # cache entry currently playing
+        self._alert_channels: list = []  # reserved mixer channels for decoded ("buf") sounds
+        self._alert_channel = None  # channel of the most recent "buf" alert (volume slider / _is_playing)
+        self._next_channel = 0  # round-robin start for _pick_alert_channel
+        self._last_audio_error: Optional[float] = None  # monotonic time of the last error dialog
+        self._audio_lock = threading.Lock()  # playback state is touched by the Tk and bot threads
+        # Serialises mixer.music load+play and Sound decoding. Taken before _audio_lock (never inside
+        # it) so a slow load doesn't hold up the bot thread's Sound plays or the Tk thread's stop.
+        self._music_lock = threading.Lock()
+        self._music_loaded: Optional[str] = None  # file currently loaded into mixer.music
         self._now_playing_rule_id: Optional[str] = None
         self._now_playing_volume: int = 100
 
@@ -228,7 +423,7 @@ class TalkAlertApp(tb.Window):
 
         # minimize -> tray
         self.bind("<Unmap>", self._on_unmap)
-        self._start_minimize_watchdog()
+        self.bind("<Map>", self._on_map)
 
         # fill table
         self._refresh_table()
@@ -288,9 +483,9 @@ class TalkAlertApp(tb.Window):
         try:
             for fn in ico_candidates:
                 p = resource_path(fn)
-                if p.exists():
+                if os.path.isfile(p):
                     try:
-                        self.iconbitmap(str(p))
+                        self.iconbitmap(p)
                         break
                     except Exception:
                         pass
@@ -301,9 +496,9 @@ class TalkAlertApp(tb.Window):
         try:
             for fn in png_candidates:
                 p = resource_path(fn)
-                if p.exists():
+                if os.path.isfile(p):
                     try:
-                        self._tk_icon_img = tk.PhotoImage(file=str(p))
+                        self._tk_icon_img = tk.PhotoImage(file=p)
                         self.iconphoto(True, self._tk_icon_img)
                         break
                     except Exception:
@@ -316,8 +511,10 @@ class TalkAlertApp(tb.Window):
     # UI building
     # ------------------------------------------------------------
     def _build_ui(self):
+        """Build header + rules table now; the form/actions/footer follow once the window is mapped (_on_map)."""
         root = tb.Frame(self, padding=12)
         root.pack(fill=BOTH, expand=YES)
+        self._ui_root = root
 
         header = tb.Frame(root)
         header.pack(fill=X)
@@ -326,8 +523,10 @@ class TalkAlertApp(tb.Window):
         self.dot_canvas = tk.Canvas(header, width=16, height=16, highlightthickness=0, bg=bg)
         self.dot_canvas.pack(side=LEFT, padx=(0, 6), pady=(2, 0))
         self._dot_id = self.dot_canvas.create_oval(3, 3, 13, 13, fill="#e74c3c", outline="")
+        self._dot_color = "#e74c3c"  # last fill applied to the dot
 
         self.status_var = tk.StringVar(value="Bot: offline")
+        self._status_text = "Bot: offline"  # last text set on status_var
         self.lbl_status = tb.Label(
             header,
             textvariable=self.status_var,
@@ -401,19 +600,33 @@ class TalkAlertApp(tb.Window):
         self._drag_iid = None
         self._dragging = False
         self._drag_win = None
+        self._drag_hint_text = ""
+        self._drag_last_target = None
         self.tree.configure(cursor="hand2")
         self.tree.bind("<ButtonPress-1>", self._on_tree_press, add="+")
         self.tree.bind("<B1-Motion>", self._on_tree_motion, add="+")
         self.tree.bind("<ButtonRelease-1>", self._on_tree_release, add="+")
 
+        # initial bot status display
+        if self.bot_token:
+            self._set_bot_state("offline", "Bot: offline")
+        else:
+            self._set_bot_state("offline", "Bot: TOKEN未設定（⚙で設定）")
+
+    def _build_ui_bottom(self):
+        root = self._ui_root
+
         # Form
         form = tb.Frame(root, padding=(12, 10))
         form.pack(fill=X, pady=(8, 0))
 
+        def caption(text: str, row: int, column: int, **grid):
+            tb.Label(form, text=text, style=STYLE_CAPTION).grid(row=row, column=column, sticky=W, **grid)
+
         # Row 0: labels
-        tb.Label(form, text="Name (任意)", bootstyle="secondary").grid(row=0, column=0, sticky=W)
-        tb.Label(form, text="UserID", bootstyle="secondary").grid(row=0, column=1, sticky=W)
-        tb.Label(form, text="Sound (wav/mp3)", bootstyle="secondary").grid(row=0, column=2, sticky=W)
+        caption("Name (任意)", 0, 0)
+        caption("UserID", 0, 1)
+        caption("Sound (wav/mp3)", 0, 2)
 
         # Row 1: entries + Browse/Test
         self.entry_name = tb.Entry(form)
@@ -436,8 +649,8 @@ class TalkAlertApp(tb.Window):
         btn_test.grid(row=1, column=4, sticky=E, pady=(4, 0), padx=(8, 0))
 
         # Row 2/3: Pushover push sound (per rule) + Volume
-        tb.Label(form, text="Push音(Pushover)", bootstyle="secondary").grid(row=2, column=0, sticky=W, pady=(10, 0))
-        tb.Label(form, text="Volume", bootstyle="secondary").grid(row=2, column=2, sticky=W, pady=(10, 0))
+        caption("Push音(Pushover)", 2, 0, pady=(10, 0))
+        caption("Volume", 2, 2, pady=(10, 0))
 
         self.var_pushover_sound = tk.StringVar(value="")
         self.entry_pushover_sound = tb.Entry(form, textvariable=self.var_pushover_sound)
@@ -446,6 +659,7 @@ class TalkAlertApp(tb.Window):
         bind_edit_context_menu(self.entry_pushover_sound)
 
         self.var_volume = tk.IntVar(value=100)
+        self._volume_after_id = None
         self.scale_volume = tb.Scale(
             form,
             from_=0,
@@ -453,10 +667,11 @@ class TalkAlertApp(tb.Window):
             length=300,
             orient=HORIZONTAL,
             variable=self.var_volume,
-            command=lambda _v: self._update_volume_label(),
+            command=self._on_volume_scale,
         )
         self.scale_volume.grid(row=3, column=2, columnspan=2, sticky=EW, pady=(4, 0), padx=(0, 10))
-        self.lbl_volume = tb.Label(form, text="100%", bootstyle="secondary", width=5, anchor=E)
+        self.lbl_volume = tb.Label(form, text="100%", style=STYLE_CAPTION, width=5, anchor=E)
+        self._volume_label_value = 100  # value lbl_volume currently shows
         self.lbl_volume.grid(row=3, column=4, sticky=W, pady=(4, 0))
         self._update_volume_label()
 
@@ -481,14 +696,6 @@ class TalkAlertApp(tb.Window):
 ##        tb.Label(root, text=note, bootstyle="secondary", justify=LEFT, font=self.font_small, wraplength=690).pack(fill=X, pady=(8, 0))
         tb.Label(root, text=f"Config: {CONFIG_PATH}", bootstyle="secondary", font=self.font_small).pack(fill=X, pady=(4, 0))
 
-        # initial bot status display
-        if self.bot_token:
-            self._set_bot_state("offline", "Bot: offline")
-        else:
-            self._set_bot_state("offline", "Bot: TOKEN未設定（⚙で設定）")
-
-        self._tick_blink()
-
         # ------------------------------------------------------------
     # Tray (minimize to tray)
     # ------------------------------------------------------------
@@ -508,22 +715,30 @@ class TalkAlertApp(tb.Window):
         ]
         for fn in candidates:
             try:
-                p = resource_path(fn)
-                if not p.exists():
-                    continue
-                img = Image.open(p)
-
-                # If ICO has multiple sizes, pick the largest when possible.
-                try:
-                    if hasattr(img, "sizes") and img.sizes:
-                        best = max(img.sizes, key=lambda s: s[0] * s[1])
-                        if hasattr(img, "getimage"):
-                            img = img.getimage(best)
-                except Exception:
-                    pass
-
-                img = img.convert("RGBA").resize((64, 64))
-                return img
+                # missing file -> except below -> next candidate; the with closes the file as soon as
+                # the pixels are copied out (an open handle would keep the PyInstaller temp dir locked)
+                with Image.open(resource_path(fn)) as src:
+                    img = src
+                    # If ICO has multiple sizes, take the 64x64 frame, else the smallest one that is
+                    # at least that big (least downsampling), else the largest.
+                    # Pillow's IcoImageFile lists the frames in info["sizes"]; assigning img.size
+                    # selects which one load() decodes.
+                    sizes = img.info.get("sizes") if img.format == "ICO" else None
+                    if sizes:
+                        try:
+                            big = [s for s in sizes if s[0] >= 64 and s[1] >= 64]
+                            if big:
+                                best = min(big, key=lambda s: s[0] * s[1])
+                            else:
+                                best = max(sizes, key=lambda s: s[0] * s[1])
+                            img.size = best
+                        except Exception:
+                            pass
+
+                    img = img.convert("RGBA")  # before resizing: palette images would resample NEAREST
+                    if img.size != (64, 64):
+                        img = img.resize((64, 64))
+                    return img
             except Exception:
                 continue
 
@@ -550,7 +765,7 @@ class TalkAlertApp(tb.Window):
         try:
             # If visible, hide to tray (force)
             if self.winfo_viewable() and self.state() != "iconic":
-                if not _HAS_TRAY:
+                if not _load_tray():
                     return
                 if not self._start_tray():
                     return
@@ -568,12 +783,14 @@ class TalkAlertApp(tb.Window):
 
 
     def _ensure_tray_icon(self) -> bool:
-        if not _HAS_TRAY:
+        if not _load_tray():
             return False
         if self._tray_icon is not None:
             return True
 
-        image = self._build_tray_image()
+        if self._tray_image is None:
+            self._tray_image = self._build_tray_image()
+        image = self._tray_image
         if image is None:
             return False
 
@@ -634,7 +851,9 @@ class TalkAlertApp(tb.Window):
         self._tray_thread.start()
         return True
 
-    def _stop_tray(self):
+    def _stop_tray(self, join: bool = True):
+        # join=False (exit): just ask the icon to go away; _exit_if_threads_linger() covers a tray
+        # thread that outlives it.
         try:
             if self._tray_icon:
                 self._tray_icon.stop()
@@ -642,7 +861,7 @@ class TalkAlertApp(tb.Window):
             pass
 
         t = self._tray_thread
-        if t and t.is_alive():
+        if join and t and t.is_alive():
             try:
                 t.join(timeout=1.5)
             except Exception:
@@ -656,7 +875,7 @@ class TalkAlertApp(tb.Window):
             return
         if not self.tray_on_minimize:
             return
-        if not _HAS_TRAY:
+        if not _load_tray():
             return  # tray feature unavailable
 
         # Start tray first; if it fails, do not withdraw (avoid "vanishing" app)
@@ -694,47 +913,42 @@ class TalkAlertApp(tb.Window):
         except Exception:
             pass
 
-
-
-        self._in_tray = False
-        try:
-            self.deiconify()
-            self.state("normal")
-            self.lift()
-            self.focus_force()
-        except Exception:
-            pass
-
         self._stop_tray()
 
-    def _on_unmap(self, _evt=None):
+    def _on_unmap(self, evt=None):
         # Triggered when window is minimized (iconic) or withdrawn.
+        # The binding on the root also sees every child widget's Unmap; only the window itself matters.
+        if evt is not None and evt.widget is not self:
+            return
+        if self._unmap_after_id is not None:
+            return  # a re-check is already pending
         # On some systems, state() is not yet updated at the event timing, so re-check after a short delay.
         def late_check():
+            self._unmap_after_id = None
             try:
                 if self.tray_on_minimize and self.state() == "iconic" and not self._in_tray:
                     self._hide_to_tray()
             except Exception:
                 pass
         try:
-            self.after(80, late_check)
+            self._unmap_after_id = self._after(80, late_check)
         except Exception:
             pass
 
-    def _start_minimize_watchdog(self):
-        """Fallback watcher: ensures minimize-to-tray works even if events are missed."""
-        def poll():
-            try:
-                if self.tray_on_minimize and not self._in_tray and self.state() == "iconic":
-                    self._hide_to_tray()
-            except Exception:
-                pass
-            finally:
-                aid = self.after(350, poll)
-                self._after_ids.add(aid)
-
-        aid = self.after(350, poll)
-        self._after_ids.add(aid)
+    def _on_map(self, evt=None):
+        # Window shown again without going through the tray menu: keep tray state in sync.
+        if evt is not None and evt.widget is not self:
+            return
+        if self._first_map_pending:
+            # First map: finish the form, then init the mixer and decode short rule sounds so the
+            # first alert plays without load latency. Not after_idle: that runs before the window
+            # is mapped, so the pygame import would still hold back the first frame.
+            self._first_map_pending = False
+            self._after(1, self._build_ui_bottom)
+            self._after(1, self._preload_sounds)
+        if self._in_tray:
+            self._in_tray = False
+            self._stop_tray()
 
 
 
@@ -868,6 +1082,7 @@ class TalkAlertApp(tb.Window):
             self.pushover_include_message = bool(po_include_msg_var.get())
             self.pushover_user_key = po_user_var.get().strip()
             self.pushover_app_token = po_app_var.get().strip()
+            self._recompute_po_active()
 
             # If token field is empty: keep existing token (do not overwrite),
             # but still save other settings.
@@ -905,6 +1120,7 @@ class TalkAlertApp(tb.Window):
                 self.pushover_include_message = bool(po_include_msg_var.get())
                 self.pushover_user_key = po_user_var.get().strip()
                 self.pushover_app_token = po_app_var.get().strip()
+                self._recompute_po_active()
                 self._save_config()
                 self._stop_bot_async()
                 self._set_bot_state("offline", "Bot: TOKEN未設定（⚙で設定）")
@@ -925,15 +1141,29 @@ class TalkAlertApp(tb.Window):
         except Exception:
             pass
 
+    def _read_config_data(self) -> Optional[dict]:
+        """Return parsed config.json (None if missing)."""
+        try:
+            with open(CONFIG_PATH, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return None
+        return _json_loads(raw)
+
     def _load_config(self):
         self._ensure_config_dir()
-        if not CONFIG_PATH.exists():
-            return
         try:
-            data = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+            data = self._read_config_data()
+            if data is None:
+                return
             self.muted = bool(data.get("mute", False))
             self.bot_token = str(data.get("token", "") or "").strip()
             self.tray_on_minimize = bool(data.get("tray_on_minimize", True))
+            try:
+                lo, hi = AUDIO_BUFFER_RANGE
+                self.audio_buffer = max(lo, min(hi, int(data.get("audio_buffer", AUDIO_BUFFER_DEFAULT))))
+            except (TypeError, ValueError):
+                self.audio_buffer = AUDIO_BUFFER_DEFAULT
 
             # pushover (iOS push)
             self.pushover_enabled = bool(data.get("pushover_enabled", False))
@@ -950,6 +1180,8 @@ class TalkAlertApp(tb.Window):
                 if not user_id:
                     continue
 
+                # older configs stored the path as typed; normalize so one file has one cache entry
+                sound_path = str(r.get("sound_path", "")).strip()
                 po_sound = str(r.get("pushover_sound", "") or "").strip()
                 if not po_sound and legacy_po_sound:
                     po_sound = legacy_po_sound
@@ -958,21 +1190,53 @@ class TalkAlertApp(tb.Window):
                     Rule(
                         name=str(r.get("name", "")).strip(),
                         user_id=user_id,
-                        sound_path=str(r.get("sound_path", "")).strip(),
+                        sound_path=_normalize_sound_path(sound_path) if sound_path else "",
                         volume=max(0, min(100, int(r.get("volume", 100) or 100))),
                         pushover_sound=po_sound,
                     )
                 )
         except Exception:
             self.rules = []
+        self._recompute_po_active()
+        self._reindex_rules()
+
+    def _reindex_rules(self):
+        """Rebuild the user_id lookup maps (call after rules are added/changed/removed)."""
+        # reversed(): on duplicate IDs the first rule wins, as with the old linear scan
+        self._rules_by_id = {r.user_id: r for r in reversed(self.rules)}
+        self._rules_by_uid = {r._user_id_int: r for r in reversed(self.rules) if r._user_id_int}
+
+    def _index_rule(self, r: Rule):
+        self._rules_by_id.setdefault(r.user_id, r)
+        if r._user_id_int:
+            self._rules_by_uid.setdefault(r._user_id_int, r)
+
+    def _unindex_rule(self, r: Rule, user_id: str, user_id_int: int):
+        """Drop r's map entries for the given (possibly previous) IDs."""
+        if self._rules_by_id.get(user_id) is r:
+            del self._rules_by_id[user_id]
+        if self._rules_by_uid.get(user_id_int) is r:
+            del self._rules_by_uid[user_id_int]
 
     def _save_config(self):
-        self._ensure_config_dir()
+        """Schedule a config write CONFIG_SAVE_DELAY_MS from now; each call pushes it back,
+        so a burst of edits (drag reorder, repeated updates) ends in a single write."""
+        self._after_cancel(self._save_after_id)
+        try:
+            self._save_after_id = self._after(CONFIG_SAVE_DELAY_MS, self._write_config)
+        except Exception:
+            self._write_config()
+
+    def _write_config(self, sync: bool = False):
+        """Serialize the config and hand it to the writer thread (sync=True: write it here, e.g. at exit)."""
+        self._after_cancel(self._save_after_id)  # no-op when called from the timer itself
+        self._save_after_id = None
         try:
             data = {
                 "mute": self.muted,
                 "token": self.bot_token,
                 "tray_on_minimize": self.tray_on_minimize,
+                "audio_buffer": self.audio_buffer,
 
                 # pushover (iOS push)
                 "pushover_enabled": self.pushover_enabled,
@@ -981,27 +1245,139 @@ class TalkAlertApp(tb.Window):
                 "pushover_push_when_muted": self.pushover_push_when_muted,
                 "pushover_include_message": self.pushover_include_message,
 
-                "rules": [
-                    {
-                        "name": r.name,
-                        "user_id": r.user_id,
-                        "sound_path": r.sound_path,
-                        "volume": int(getattr(r, "volume", 100)),
-                        "pushover_sound": str(getattr(r, "pushover_sound", "") or "").strip(),
-                    }
-                    for r in self.rules
-                ],
+                "rules": [r.as_dict() for r in self.rules],
             }
-            CONFIG_PATH.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+            payload = _json_dumps(data)
+            if payload == self._last_config_bytes:
+                # nothing changed since the last write (at exit: unless that write is still queued)
+                if not sync or self._cfg_written_seq >= self._cfg_seq:
+                    return
+            self._last_config_bytes = payload
+            self._cfg_seq += 1
+            job = (self._cfg_seq, payload)
         except Exception:
-            pass
+            return
+
+        if sync:
+            self._write_config_file(job)
+            return
+        q = self._cfg_queue
+        while True:
+            try:
+                q.put_nowait(job)
+                break
+            except queue.Full:
+                try:
+                    q.get_nowait()  # superseded by this newer payload
+                except queue.Empty:
+                    pass
+        if self._cfg_writer is None or not self._cfg_writer.is_alive():
+            self._cfg_writer = threading.Thread(target=self._config_writer, daemon=True)
+            self._cfg_writer.start()
+
+    def _config_writer(self):
+        while True:
+            job = self._cfg_queue.get()
+            if job is None:
+                return
+            self._write_config_file(job)
+
+    def _write_config_file(self, job: tuple):
+        """Write one payload (temp file + os.replace, so a crash never leaves a torn file)."""
+        seq, payload = job
+        with self._cfg_lock:
+            if seq <= self._cfg_written_seq:
+                return  # a newer payload is already on disk
+            try:
+                tmp = CONFIG_PATH.with_suffix(".json.tmp")
+                with open(tmp, "wb") as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())  # data on disk before the rename, or a crash can leave an empty config
+                os.replace(tmp, CONFIG_PATH)
+                self._cfg_written_seq = seq
+            except Exception:
+                self._last_config_bytes = None  # not on disk; let the next save retry
+
+    def _request_refresh(self, select: Optional[str] = None):
+        """Schedule one _refresh_table for the current event-loop pass (repeated requests collapse)."""
+        if select is not None:
+            self._refresh_select = select
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        try:
+            self._after_idle(self._do_refresh)
+        except Exception:
+            self._refresh_pending = False
+
+    def _do_refresh(self):
+        self._refresh_pending = False
+        select, self._refresh_select = self._refresh_select, None
+        self._refresh_table()
+        if select:
+            try:
+                self.tree.selection_set(select)
+                self.tree.focus(select)
+            except Exception:
+                pass
 
     def _refresh_table(self):
-        for iid in self.tree.get_children():
-            self.tree.delete(iid)
+        """Sync the tree with self.rules: insert/delete/update only rows that changed, then fix order."""
+        tree = self.tree
+        rows = self._tree_rows
+
+        # row tuples built once per pass; iids must be unique, so the first rule wins
+        wanted = {}
         for r in self.rules:
-            self.tree.insert("", "end", iid=r.user_id, values=(r.name, r.user_id, r.sound_filename, f"{int(getattr(r, 'volume', 100))}%", getattr(r, 'pushover_sound', '')))
+            uid = r.user_id
+            if uid not in wanted:
+                wanted[uid] = (r.name, uid, r.sound_filename, f"{r.volume}%", r.pushover_sound)
+
+        if not rows:
+            self._refresh_table_bulk(wanted)
+            return
 
+        delete, insert, item = tree.delete, tree.insert, tree.item
+        for iid in [iid for iid in rows if iid not in wanted]:
+            delete(iid)
+            del rows[iid]
+
+        get_row = rows.get
+        for iid, values in wanted.items():
+            old = get_row(iid)
+            if old is None:
+                insert("", "end", iid=iid, values=values)
+            elif old != values:
+                item(iid, values=values)
+            else:
+                continue
+            rows[iid] = values
+
+        order = list(wanted)
+        current = list(tree.get_children())
+        if current != order:
+            for idx, iid in enumerate(order):
+                if current[idx] != iid:
+                    tree.move(iid, "", idx)
+                    current.remove(iid)
+                    current.insert(idx, iid)
+
+        self._update_mute_button()
+
+    def _refresh_table_bulk(self, wanted: dict):
+        """Empty tree (startup / everything removed): append rows in order, no diff or reorder pass."""
+        insert = self.tree.insert
+        for iid, values in wanted.items():
+            insert("", "end", iid=iid, values=values)
+        self._tree_rows.update(wanted)
+        self._update_mute_button()
+
+    def _update_mute_button(self):
+        # every table refresh lands here; only reconfigure when the state actually flipped
+        if self.muted == self._muted_rendered:
+            return
+        self._muted_rendered = self.muted
         if self.muted:
             self.btn_mute.configure(text="🔇 Mute: ON", bootstyle="danger")
         else:
@@ -1032,29 +1408,25 @@ class TalkAlertApp(tb.Window):
                 self._name_sort_asc = not getattr(self, "_name_sort_asc", True)
 
             asc = getattr(self, "_name_sort_asc", True)
-            self.rules.sort(key=lambda r: (r.name or "").casefold())
-            if not asc:
-                self.rules.reverse()
+            self.rules.sort(key=attrgetter("sort_key"), reverse=not asc)
 
             self._save_config()
-            self._refresh_table()
+            self._request_refresh()
             self._update_name_heading()
         except Exception:
             pass
 
-    def _sync_rules_from_tree_order(self):
-        """Treeviewの表示順を self.rules に反映する。"""
+    def _sync_rules_from_tree_order(self, order: Optional[List[str]] = None):
+        """Treeviewの表示順を self.rules に反映する。（order 指定時はTreeを読まずにそれを使う）"""
         try:
-            order = list(self.tree.get_children())
-            by_id = {str(r.user_id): r for r in self.rules}
-            new_rules = []
-            for iid in order:
-                if iid in by_id:
-                    new_rules.append(by_id[iid])
+            if order is None:
+                order = list(self.tree.get_children())
+            by_id = self._rules_by_id
+            new_rules = [by_id[iid] for iid in order if iid in by_id]
             # 念のため：Treeにいないものがあれば末尾に残す
-            for r in self.rules:
-                if str(r.user_id) not in order:
-                    new_rules.append(r)
+            if len(new_rules) != len(self.rules):
+                placed = {id(r) for r in new_rules}
+                new_rules.extend(r for r in self.rules if id(r) not in placed)
             self.rules = new_rules
         except Exception:
             pass
@@ -1106,6 +1478,10 @@ class TalkAlertApp(tb.Window):
 
             self._drag_candidate_iid = iid
             self._drag_iid = iid
+            # 表示順のPython側ミラー（motion中はTreeに問い合わせずにこれで位置計算）
+            self._rule_order = list(self.tree.get_children(""))
+            self._drag_idx = self._rule_order.index(iid)
+            self._drag_last_target = iid
             self._dragging = False
             self._drag_started = False
             self._press_x_root = event.x_root
@@ -1153,30 +1529,35 @@ class TalkAlertApp(tb.Window):
             except Exception:
                 pass
 
-            try:
-                name = self.tree.set(iid, "name") or (self.tree.item(iid, "values") or [""])[0]
-            except Exception:
-                name = ""
-            self._show_drag_hint(event.x_root, event.y_root, f"↕ {name}")
+            name = (self._tree_rows.get(iid) or ("",))[0]
+            self._drag_hint_text = f"↕ {name}"
+            self._show_drag_hint(event.x_root, event.y_root, self._drag_hint_text)
 
         if not getattr(self, "_dragging", False):
             return
 
         # hint follow
-        try:
-            if self._drag_win:
-                self._show_drag_hint(event.x_root, event.y_root, self._drag_win.winfo_children()[0].cget("text"))
-        except Exception:
-            pass
+        if self._drag_win:
+            self._show_drag_hint(event.x_root, event.y_root, self._drag_hint_text)
 
-        # move item in-tree (no placeholder rows)
+        # move item in-tree (no placeholder rows); only touch the tree when the hovered row changes
         try:
             target = self.tree.identify_row(event.y)
+            if target == self._drag_last_target:
+                return
+            self._drag_last_target = target
+            order = self._rule_order
             if target and target != iid:
-                idx = self.tree.index(target)
-                self.tree.move(iid, "", idx)
+                new_idx = order.index(target)
             elif not target:
-                self.tree.move(iid, "", "end")
+                new_idx = len(order) - 1
+            else:
+                return
+            if new_idx != self._drag_idx:
+                order.pop(self._drag_idx)
+                order.insert(new_idx, iid)
+                self._drag_idx = new_idx
+                self.tree.move(iid, "", new_idx)
         except Exception:
             pass
 
@@ -1210,7 +1591,7 @@ class TalkAlertApp(tb.Window):
             pass
 
         try:
-            self._sync_rules_from_tree_order()
+            self._sync_rules_from_tree_order(getattr(self, "_rule_order", None))
             self._save_config()
             # ドラッグした行を選択状態のままに
             if getattr(self, "_drag_iid", None):
@@ -1228,33 +1609,50 @@ class TalkAlertApp(tb.Window):
         except Exception:
             v = 100
         v = max(0, min(100, v))
-        try:
-            self.lbl_volume.configure(text=f"{v}%")
-        except Exception:
-            pass
+        if v != self._volume_label_value:  # sub-percent slider moves land on the same value
+            try:
+                self.lbl_volume.configure(text=f"{v}%")
+                self._volume_label_value = v
+            except Exception:
+                pass
 
         # 再生中でも音量をリアルタイム反映（Test含む）
         # Only apply when the currently playing sound belongs to the selected rule.
+        # Cheap Python-side checks first; the mixer is only queried for the selected, playing rule.
         try:
-            if not self._audio_ready:
+            if not self._audio_ready or self.muted or self._now_playing_rule_id is None:
                 return
-            if self.muted:
+            if self._get_selected_user_id() != self._now_playing_rule_id:
                 return
-            if not pygame.mixer.music.get_busy():
-                return
-            selected = self._get_selected_user_id()
-            if selected and selected == self._now_playing_rule_id:
-                pygame.mixer.music.set_volume(v / 100.0)
+            if v != self._now_playing_volume and self._is_playing():
+                self._set_playing_volume(v)
                 self._now_playing_volume = v
         except Exception:
             pass
 
+    def _on_volume_scale(self, _v=None):
+        # Dragging the slider fires many callbacks; apply at most one update per 50ms.
+        if self._volume_after_id is not None:
+            return
+        try:
+            self._volume_after_id = self._after(50, self._flush_volume_scale)
+        except Exception:
+            self._update_volume_label()
+
+    def _flush_volume_scale(self):
+        self._volume_after_id = None
+        self._update_volume_label()
+
 
     def _get_selected_user_id(self) -> Optional[str]:
+        if not self._tree_rows:
+            return None  # empty table: nothing can be selected, skip the Tcl query
         sel = self.tree.selection()
         return sel[0] if sel else None
 
     def _load_selected_to_form(self, _evt=None):
+        if not hasattr(self, "entry_name"):
+            return  # form not built yet (see _build_ui_bottom)
         uid = self._get_selected_user_id()
         if not uid:
             return
@@ -1268,20 +1666,17 @@ class TalkAlertApp(tb.Window):
         self.entry_sound.delete(0, "end")
         self.entry_sound.insert(0, r.sound_path)
         try:
-            self.var_pushover_sound.set(str(getattr(r, "pushover_sound", "") or ""))
+            self.var_pushover_sound.set(r.pushover_sound)
         except Exception:
             self.var_pushover_sound.set("")
         try:
-            self.var_volume.set(int(getattr(r, "volume", 100)))
+            self.var_volume.set(r.volume)
         except Exception:
             self.var_volume.set(100)
         self._update_volume_label()
 
     def _find_rule(self, user_id: str) -> Optional[Rule]:
-        for r in self.rules:
-            if r.user_id == user_id:
-                return r
-        return None
+        return self._rules_by_id.get(user_id)
 
     # ------------------------------------------------------------
     # UI actions
@@ -1292,6 +1687,14 @@ class TalkAlertApp(tb.Window):
             self.entry_sound.delete(0, "end")
             self.entry_sound.insert(0, path)
 
+    def _checked_sound_path(self, sound: str, current: Optional[str] = None) -> str:
+        """Normalize a validated sound path once at edit time; warn now (not on every alert) if it's missing.
+        No warning when it is the rule's current path (already reported when that was set)."""
+        sound = _normalize_sound_path(sound)
+        if sound != current and not os.path.isfile(sound):
+            messagebox.showwarning(APP_NAME, f"音声ファイルが見つかりません（このまま保存します）。\n{sound}")
+        return sound
+
     def add_rule(self):
         name = self.entry_name.get().strip()
         user_id = str(self.entry_id.get()).strip()
@@ -1304,14 +1707,18 @@ class TalkAlertApp(tb.Window):
         if self._find_rule(user_id) is not None:
             messagebox.showinfo(APP_NAME, "既に登録済みです。")
             return
-        if not sound or not sound.lower().endswith(ALLOWED_AUDIO):
+        if not _validate_sound(sound):
             messagebox.showinfo(APP_NAME, "Sound は .wav または .mp3 を指定してください。")
             return
+        sound = self._checked_sound_path(sound)
 
         vol = max(0, min(100, int(self.var_volume.get() or 100)))
-        self.rules.append(Rule(name=name, user_id=user_id, sound_path=sound, volume=vol, pushover_sound=push_sound))
+        r = Rule(name=name, user_id=user_id, sound_path=sound, volume=vol, pushover_sound=push_sound)
+        self.rules.append(r)
+        self._index_rule(r)
+        self._reload_sound(sound)
         self._save_config()
-        self._refresh_table()
+        self._request_refresh()
 
         self.entry_id.delete(0, "end")
         self.entry_sound.delete(0, "end")
@@ -1335,7 +1742,7 @@ class TalkAlertApp(tb.Window):
         if not user_id:
             messagebox.showinfo(APP_NAME, "UserID を入力してください。")
             return
-        if not sound or not sound.lower().endswith(ALLOWED_AUDIO):
+        if not _validate_sound(sound):
             messagebox.showinfo(APP_NAME, "Sound は .wav または .mp3 を指定してください。")
             return
         if user_id != selected and self._find_rule(user_id) is not None:
@@ -1345,39 +1752,52 @@ class TalkAlertApp(tb.Window):
         r = self._find_rule(selected)
         if not r:
             return
+        sound = self._checked_sound_path(sound, r.sound_path)
+        try:
+            vol = max(0, min(100, int(self.var_volume.get() or 100)))
+        except Exception:
+            vol = 100
+
+        if (name, user_id, sound, vol, push_sound) == (r.name, r.user_id, r.sound_path, r.volume, r.pushover_sound):
+            return  # nothing to save, redraw or reload
 
         old_id = r.user_id
+        old_id_int = r._user_id_int
+        old_sound = r.sound_path
         r.name = name
         r.user_id = user_id
+        r._user_id_int = _parse_user_id(user_id)
         r.sound_path = sound
-        try:
-            r.pushover_sound = push_sound
-        except Exception:
-            pass
-        try:
-            r.volume = max(0, min(100, int(self.var_volume.get() or 100)))
-        except Exception:
-            r.volume = 100
+        r.pushover_sound = push_sound
+        r.volume = vol
 
         if old_id != user_id:
-            self.rules = [x for x in self.rules if (x is r) or (x.user_id != old_id)]
+            self._unindex_rule(r, old_id, old_id_int)
+            self._index_rule(r)
+
+        if old_sound != sound and not any(x.sound_path == old_sound for x in self.rules):
+            self._sound_cache.pop(old_sound, None)
+        self._reload_sound(sound)
 
         self._save_config()
-        self._refresh_table()
-        try:
-            self.tree.selection_set(user_id)
-            self.tree.focus(user_id)
-        except Exception:
-            pass
+        self._request_refresh(select=user_id)
 
     def remove_rule(self):
         selected = self._get_selected_user_id()
         if not selected:
             messagebox.showinfo(APP_NAME, "削除する行を選択してください。")
             return
-        self.rules = [r for r in self.rules if r.user_id != selected]
+        removed = self._find_rule(selected)
+        if removed is None:
+            return
+        # by identity: list.remove would call the dataclass __eq__ (a field-tuple compare) per element
+        rules = self.rules
+        del rules[next(i for i, x in enumerate(rules) if x is removed)]
+        self._unindex_rule(removed, removed.user_id, removed._user_id_int)
+        if not any(x.sound_path == removed.sound_path for x in self.rules):
+            self._sound_cache.pop(removed.sound_path, None)
         self._save_config()
-        self._refresh_table()
+        self._request_refresh()
 
         self.entry_id.delete(0, "end")
         self.entry_sound.delete(0, "end")
@@ -1389,7 +1809,7 @@ class TalkAlertApp(tb.Window):
     def test_form(self):
         """現在フォームに入力されている内容を再生してテストする（Update前でもOK）。"""
         sound = self.entry_sound.get().strip()
-        if not sound or not sound.lower().endswith(ALLOWED_AUDIO):
+        if not _validate_sound(sound):
             messagebox.showinfo(APP_NAME, "Sound は .wav または .mp3 を指定してください。")
             return
         try:
@@ -1399,7 +1819,8 @@ class TalkAlertApp(tb.Window):
 
         # selectionがあればそのルールID、なければテスト用IDで再生
         rid = self._get_selected_user_id() or "__test__"
-        self._play_sound(sound, vol, rule_id=rid)
+        # normalized like a saved rule's path; fresh=True re-reads the file every time
+        self._play_sound(_normalize_sound_path(sound), vol, rule_id=rid, interactive=True, fresh=True)
 
     # 互換：古いUIから呼ばれても動くように残す
     def test_selected(self):
@@ -1412,62 +1833,242 @@ class TalkAlertApp(tb.Window):
             self._stop_sound()
         except Exception:
             pass
+        self._update_mute_button()  # only the button changes; the rules table is untouched
         self._save_config()
-        self._refresh_table()
 
 
     # ------------------------------------------------------------
     # Audio
     # ------------------------------------------------------------
     def _init_audio(self):
-        if not _HAS_PYGAME:
+        if not _load_pygame():
             self._audio_ready = False
             return
         try:
+            # Small buffer -> alerts start promptly (default buffer adds audible delay).
+            pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=self.audio_buffer)
             pygame.mixer.init()
+            # Channels 0..ALERT_CHANNELS-1 are reserved for alerts and reused round-robin.
+            pygame.mixer.set_num_channels(max(8, ALERT_CHANNELS))
+            pygame.mixer.set_reserved(ALERT_CHANNELS)
+            self._alert_channels = [pygame.mixer.Channel(i) for i in range(ALERT_CHANNELS)]
+            self._alert_channel = self._alert_channels[0]
             self._audio_ready = True
         except Exception:
             self._audio_ready = False
+            return
+
+        # Wake the output device with a short silent clip so the first real alert isn't delayed.
+        # 4096 bytes = 1024 stereo 16-bit frames, enough to fill the mixer buffer at least once
+        # (a single frame could finish before the device had pulled anything).
+        try:
+            self._alert_channels[0].play(pygame.mixer.Sound(buffer=bytes(4096)))
+        except Exception:
+            pass
+
+    def _ensure_audio(self) -> bool:
+        if self._audio_ready is None:
+            self._init_audio()
+        return bool(self._audio_ready)
 
-    def _play_sound(self, path: str, volume: int = 100, rule_id: Optional[str] = None):
+    def _play_sound(
+        self,
+        path: str,
+        volume: int = 100,
+        rule_id: Optional[str] = None,
+        interactive: bool = False,
+        fresh: bool = False,
+    ):
+        """interactive=True (Test button): always report errors; alerts are rate-limited.
+        fresh=True: decode from disk instead of the cache (see _get_sound)."""
         if self.muted:
             return
-        if not self._audio_ready:
-            messagebox.showerror(
-                APP_NAME,
+        if not self._ensure_audio():
+            self._show_audio_error(
                 "音声再生に必要な pygame が利用できません。\n"
-                "Python 3.14 の場合は pygame-ce を推奨: pip install pygame-ce"
+                "Python 3.14 の場合は pygame-ce を推奨: pip install pygame-ce",
+                interactive,
             )
             return
         try:
-            pygame.mixer.music.stop()
-            pygame.mixer.music.load(path)
+            entry = self._get_sound(path, fresh=fresh)
+            if fresh and entry[0] == "stream" and self._music_loaded == path:
+                self._music_loaded = None  # the file may have changed since it was loaded
             try:
                 v = max(0, min(100, int(volume)))
             except Exception:
                 v = 100
-            pygame.mixer.music.set_volume(v / 100.0)
-            self._now_playing_rule_id = rule_id
-            self._now_playing_volume = v
-            pygame.mixer.music.play()
+            self._play_entry(entry, v, rule_id)
         except Exception as e:
-            messagebox.showerror(APP_NAME, f"音声ファイルを再生できません。\n{e}")
+            self._show_audio_error(f"音声ファイルを再生できません。\n{e}", interactive)
+
+    def _show_audio_error(self, text: str, force: bool = False):
+        # A broken file or unplugged device fails on every message; without a limit each one
+        # would stack another modal dialog.
+        now = time.monotonic()
+        last = self._last_audio_error
+        if not force and last is not None and now - last < AUDIO_ERROR_INTERVAL_S:
+            return
+        self._last_audio_error = now
+        messagebox.showerror(APP_NAME, text)
+
+    def _play_entry(self, entry: tuple, v: int, rule_id: Optional[str]):
+        """Start a cache entry at volume v (0-100). Any thread; no UI."""
+        kind, obj = entry
+        if kind == "stream":
+            with self._music_lock:
+                if not self._audio_ready:  # mixer closed by _cleanup
+                    return
+                if self._music_loaded != obj:  # replaying the same file reuses the open stream
+                    self._music_loaded = None
+                    pygame.mixer.music.load(obj)  # file I/O + decoder setup: outside _audio_lock
+                with self._audio_lock:
+                    if not self._audio_ready:
+                        return
+                    self._music_loaded = obj
+                    pygame.mixer.music.set_volume(v / 100.0)
+                    pygame.mixer.music.play()
+                    self._set_now_playing(entry, rule_id, v)
+            return
+        with self._audio_lock:
+            if not self._audio_ready:
+                return
+            obj.stop()  # the same clip restarts rather than doubling up
+            ch = self._pick_alert_channel()
+            ch.set_volume(v / 100.0)
+            ch.play(obj)
+            self._alert_channel = ch
+            self._set_now_playing(entry, rule_id, v)
+
+    def _set_now_playing(self, entry: tuple, rule_id: Optional[str], v: int):
+        # caller holds _audio_lock
+        self._now_playing = entry
+        self._now_playing_rule_id = rule_id
+        self._now_playing_volume = v
+
+    def _play_alert_direct(self, r: Rule) -> bool:
+        """Bot thread: play an already-decoded alert without a Tk hop. False -> caller queues it
+        for the Tk thread (audio not initialised yet, sound not cached, or streamed)."""
+        if not self._audio_ready or self.stop_event.is_set():
+            return False
+        entry = self._sound_cache.get(r.sound_path)
+        if entry is None or entry[0] != "buf":
+            return False
+        try:
+            self._play_entry(entry, r.volume, r.user_id)
+            return True
+        except Exception:
+            return False
 
-    
-    def _stop_sound(self):
+    def _pick_alert_channel(self):
+        """Next idle reserved channel (round-robin); when all are busy, the round-robin one is cut."""
+        chans = self._alert_channels
+        n = len(chans)
+        start = self._next_channel
+        idx = start
+        for k in range(n):
+            i = (start + k) % n
+            if not chans[i].get_busy():
+                idx = i
+                break
+        self._next_channel = (idx + 1) % n
+        return chans[idx]
+
+    def _get_sound(self, path: str, fresh: bool = False) -> tuple:
+        """Return the cache entry for path: a decoded Sound for short clips, or a stream marker
+        for long files (streamed from disk by mixer.music instead of held in RAM).
+
+        fresh=True always decodes again and only refreshes an entry that is already cached, so
+        auditioned files that no rule uses are not kept in memory."""
+        entry = None if fresh else self._sound_cache.get(path)
+        if entry is None:
+            is_mp3 = path.lower().endswith(".mp3")
+            limit = SOUND_STREAM_MIN_BYTES_MP3 if is_mp3 else SOUND_STREAM_MIN_BYTES
+            if os.path.getsize(path) >= limit:
+                entry = ("stream", path)
+            else:
+                # worker threads decode here too; _cleanup quits the mixer under the same lock
+                with self._music_lock:
+                    if not self._audio_ready:
+                        raise RuntimeError("audio is shut down")
+                    try:
+                        entry = ("buf", pygame.mixer.Sound(path))
+                    except pygame.error:
+                        if not is_mp3:
+                            raise
+                        entry = ("stream", path)  # SDL_mixer built without MP3 support for Sound
+            if not fresh or path in self._sound_cache:
+                self._sound_cache[path] = entry
+        return entry
+
+    def _preload_sounds(self, paths: Optional[List[str]] = None):
+        """Decode sounds into the cache on a worker thread (default: every rule's sound)."""
+        if not self._ensure_audio():  # mixer init stays on the Tk thread
+            return
+        if paths is None:
+            paths = list(dict.fromkeys(r.sound_path for r in self.rules))
+
+        def worker():
+            for path in paths:
+                if self.stop_event.is_set():
+                    return
+                try:
+                    self._get_sound(path)
+                except Exception:
+                    pass
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _reload_sound(self, path: str):
+        """Drop a cached entry (file may have changed) and load it again in the background."""
+        self._sound_cache.pop(path, None)
+        if self._music_loaded == path:
+            self._music_loaded = None
         if not self._audio_ready:
             return
+        self._preload_sounds([path])
+
+    def _is_playing(self) -> bool:
+        entry = self._now_playing
+        if entry is None:
+            return False
         try:
-            pygame.mixer.music.stop()
+            kind, obj = entry
+            if kind == "stream":
+                return bool(pygame.mixer.music.get_busy())
+            return bool(self._alert_channel.get_busy())
         except Exception:
-            pass
-        self._now_playing_rule_id = None
+            return False
+
+    def _set_playing_volume(self, v: int):
+        entry = self._now_playing
+        if entry is None:
+            return
+        kind, obj = entry
+        if kind == "stream":
+            pygame.mixer.music.set_volume(v / 100.0)
+        else:
+            self._alert_channel.set_volume(v / 100.0)
+
+    def _stop_sound(self):
+        if not self._audio_ready:
+            return
+        # everything audible stops (mute, exit), not just the most recent alert
+        with self._audio_lock:
+            try:
+                pygame.mixer.music.stop()
+                for ch in self._alert_channels:
+                    ch.stop()
+            except Exception:
+                pass
+            self._now_playing = None
+            self._now_playing_rule_id = None
 
 # ------------------------------------------------------------
     # Bot (auto)
     # ------------------------------------------------------------
     def _auto_start_bot(self):
-        if not _HAS_DISCORD:
+        if not _load_discord():
             self._set_bot_state("offline", "Bot: discord.py が未インストール")
             return
         if not self.bot_token:
@@ -1477,46 +2078,63 @@ class TalkAlertApp(tb.Window):
         self._start_bot_async()
 
     def _start_bot_async(self):
-        with self._bot_thread_lock:
-            if self._bot_thread and self._bot_thread.is_alive():
-                return
-            self._set_bot_state("connecting", "Bot: connecting...")
-            self._bot_thread = threading.Thread(target=self._run_bot_thread, daemon=True)
-            self._bot_thread.start()
+        # Tk thread only (see _restart_bot_async), so no lock is needed around the thread check.
+        if self._bot_thread and self._bot_thread.is_alive():
+            return
+        self._set_bot_state("connecting", "Bot: connecting...")
+        self._ensure_pushover_worker()
+        self._bot_thread = threading.Thread(target=self._run_bot_thread, daemon=True)
+        self._bot_thread.start()
 
     def _stop_bot_async(self):
         threading.Thread(target=self._stop_bot, daemon=True).start()
 
     def _restart_bot_async(self):
+        t = self._bot_thread
+        if t and t.is_alive() and self._bot_running_token == self.bot_token:
+            return  # client already running with this token: nothing to rebuild
+
         def worker():
             self._stop_bot()
             time.sleep(0.4)
-            self._auto_start_bot()
+            self._ui_call(self._auto_start_bot)  # touches Tk widgets: back on the Tk thread
         threading.Thread(target=worker, daemon=True).start()
 
-    def _stop_bot(self):
+    def _signal_bot_stop(self):
+        """Ask the client to close on its own loop; returns the close future (or None) without waiting."""
         try:
             if self._discord_client and self._discord_loop and self._discord_loop.is_running():
-                fut = asyncio.run_coroutine_threadsafe(self._discord_client.close(), self._discord_loop)
-                try:
-                    fut.result(timeout=2.5)
-                except Exception:
-                    pass
+                return asyncio.run_coroutine_threadsafe(self._discord_client.close(), self._discord_loop)
         except Exception:
             pass
+        return None
+
+    def _join_bot(self, fut=None, timeout: float = 2.5):
+        """Wait for close + bot thread exit. Blocks: call from a worker thread, not the Tk thread."""
+        if fut is not None:
+            try:
+                fut.result(timeout=timeout)
+            except Exception:
+                pass
 
         t = self._bot_thread
         if t and t.is_alive():
             try:
-                t.join(timeout=2.5)
+                t.join(timeout=timeout)
             except Exception:
                 pass
 
+    def _stop_bot(self):
+        self._join_bot(self._signal_bot_stop())
+
         self._discord_client = None
         self._discord_loop = None
         self._bot_thread = None
+        self._bot_running_token = ""
 
     def _run_bot_thread(self):
+        token = self.bot_token
+        self._bot_running_token = token
         try:
             intents = discord.Intents.default()
             intents.message_content = True
@@ -1528,30 +2146,31 @@ class TalkAlertApp(tb.Window):
 
             @client.event
             async def on_ready():
-                self._ui_call(lambda: self._set_bot_state("online", f"Bot: online ({client.user})"))
+                self._ui_call(functools.partial(self._set_bot_state, "online", f"Bot: online ({client.user})"))
 
             @client.event
             async def on_disconnect():
-                self._ui_call(lambda: self._set_bot_state("offline", "Bot: disconnected"))
+                self._ui_call(functools.partial(self._set_bot_state, "offline", "Bot: disconnected"))
 
             @client.event
             async def on_resumed():
-                self._ui_call(lambda: self._set_bot_state("online", f"Bot: online ({client.user})"))
+                self._ui_call(functools.partial(self._set_bot_state, "online", f"Bot: online ({client.user})"))
 
             @client.event
             async def on_message(message):
                 try:
                     if message.author.bot:
                         return
-                    uid = str(message.author.id)
-                    r = self._find_rule(uid)
+                    r = self._rules_by_uid.get(message.author.id)
                     if r is None:
                         return
-                    self._ui_call(lambda: self._play_sound(r.sound_path, int(getattr(r, 'volume', 100)), rule_id=r.user_id))
+                    muted = self.muted
+                    if not muted and not self._play_alert_direct(r):
+                        self._queue_play(r)  # muted: no wake-up at all (_play_sound would drop it)
                     # Pushover push (optional)
                     try:
-                        if self.pushover_enabled and self.pushover_app_token and self.pushover_user_key:
-                            if (not self.muted) or self.pushover_push_when_muted:
+                        if self._po_active:
+                            if (not muted) or self.pushover_push_when_muted:
                                 who = (r.name or getattr(message.author, 'display_name', '') or 'User')
                                 where = "DM"
                                 try:
@@ -1567,28 +2186,183 @@ class TalkAlertApp(tb.Window):
                                 else:
                                     msg = f"{who} @ {where}"
                                 jump = getattr(message, 'jump_url', None)
-                                await self._pushover_send_async(APP_NAME, msg, url=jump, sound=getattr(r, 'pushover_sound', ''))
+                                self._pushover_enqueue(APP_NAME, msg, url=jump, sound=r.pushover_sound)
                     except Exception:
                         pass
                 except Exception:
                     pass
 
-            self._discord_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self._discord_loop)
-            client.run(self.bot_token)
+            asyncio.run(self._bot_main(client, token))
         except Exception as e:
-            self._ui_call(lambda: self._set_bot_state("offline", f"Bot: start failed ({e})"))
+            # partial binds the text now; a lambda would read e after the except block has unbound it
+            self._ui_call(functools.partial(self._set_bot_state, "offline", f"Bot: start failed ({e})"))
+        finally:
+            self._discord_loop = None
+
+    async def _bot_main(self, client, token: str):
+        # Record the loop the client actually runs on, so _stop_bot can close it from the UI thread.
+        # (client.run() creates its own loop internally, which left _discord_loop pointing at an idle one.)
+        self._discord_loop = asyncio.get_running_loop()
+        async with client:
+            await client.start(token)
+
+    def _queue_play(self, r: Rule):
+        """Bot thread: hand an alert that needs disk work (decode / stream load) to the audio worker,
+        so neither the bot loop nor the Tk thread waits on it."""
+        self._play_queue.put(r)
+        t = self._audio_worker
+        if t is None or not t.is_alive():
+            self._audio_worker = threading.Thread(target=self._audio_worker_loop, daemon=True)
+            self._audio_worker.start()
+
+    def _audio_worker_loop(self):
+        q = self._play_queue
+        while True:
+            r = q.get()
+            if r is None:
+                return
+            burst = {r.user_id: r}  # one alert per rule per burst (repeats would only restart the same clip)
+            stop = False
+            while True:
+                try:
+                    r = q.get_nowait()
+                except queue.Empty:
+                    break
+                if r is None:
+                    stop = True
+                    break
+                burst.pop(r.user_id, None)
+                burst[r.user_id] = r
+            for r in burst.values():
+                self._play_alert_worker(r)
+            if stop:
+                return
 
-    def _ui_call(self, fn):
+    def _play_alert_worker(self, r: Rule):
+        if self.muted or self.stop_event.is_set():
+            return
+        if not self._audio_ready:
+            # mixer not initialised yet (or unavailable): the Tk path inits it and reports errors
+            self._ui_call(functools.partial(self._play_sound, r.sound_path, r.volume, rule_id=r.user_id))
+            return
         try:
-            self.after(0, fn)
-        except Exception:
-            pass
+            self._play_entry(self._get_sound(r.sound_path), r.volume, r.user_id)
+        except Exception as e:
+            if not self.stop_event.is_set():
+                self._ui_call(functools.partial(self._show_audio_error, f"音声ファイルを再生できません。\n{e}"))
+
+    def _ui_call(self, fn):
+        """Run fn on the Tk thread (callable from any thread). Calls queued before the next drain
+        share a single Tk event instead of one after(0) each."""
+        self._ui_queue.put(fn)
+        if not self._ui_drain_pending:
+            self._ui_drain_pending = True
+            try:
+                self.after(0, self._ui_drain)
+            except Exception:
+                pass
+
+    def _ui_drain(self):
+        # Clear first: anything queued from here on schedules the next drain itself.
+        self._ui_drain_pending = False
+        q = self._ui_queue
+        while True:
+            try:
+                fn = q.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                fn()
+            except Exception:
+                pass
 
 
     # ------------------------------------------------------------
     # Pushover (iOS push)
     # ------------------------------------------------------------
+    def _new_pushover_session(self):
+        """HTTPS keep-alive session so repeated pushes skip the TLS handshake (requires requests)."""
+        if not _load_requests():
+            return None
+        try:
+            session = requests.Session()
+            session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4))
+            return session
+        except Exception:
+            return None
+
+    def _recompute_po_active(self):
+        """Cache the Pushover on/off gate checked per message (call whenever the settings change)."""
+        self._po_active = bool(self.pushover_enabled and self.pushover_app_token and self.pushover_user_key)
+
+    def _pushover_body(
+        self,
+        app_token: str,
+        user_key: str,
+        title: str,
+        message: str,
+        url: Optional[str] = None,
+        url_title: str = "",
+        sound: str = "",
+    ) -> bytes:
+        """Form-encode a request body. The token/user prefix is quoted once and reused while unchanged;
+        title/url_title/sound repeat across pushes and come from a small quote cache.
+        Only message and url are quoted per call."""
+        cached = self._po_body_prefix
+        if cached is None or cached[0] != (app_token, user_key):
+            prefix = "token=" + urllib.parse.quote_plus(app_token) + "&user=" + urllib.parse.quote_plus(user_key)
+            cached = self._po_body_prefix = ((app_token, user_key), prefix)
+
+        parts = [cached[1], "&title=", _quote_stable(title), "&message=", urllib.parse.quote_plus(message)]
+        if url:
+            parts += ["&url=", urllib.parse.quote_plus(url), "&url_title=", _quote_stable(url_title)]
+        # Optional sound (Pushover built-in sound name)
+        if sound:
+            parts += ["&sound=", _quote_stable(sound)]
+        return "".join(parts).encode("utf-8")
+
+    def _pushover_post_conn(self, data: bytes) -> tuple[int, bytes]:
+        """POST over a persistent HTTPSConnection (used when requests is not installed)."""
+        with self._po_conn_lock:
+            try:
+                return self._pushover_post_once(data)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # kept-alive socket was closed by the server in the meantime: reconnect once
+                return self._pushover_post_once(data)
+
+    def _new_pushover_conn(self) -> http.client.HTTPSConnection:
+        """HTTPSConnection to Pushover, tunnelled through the HTTPS proxy urllib would use
+        (HTTPS_PROXY / the Windows system proxy) unless the host is bypassed."""
+        import base64
+        import urllib.request  # only on this path; getproxies() reads the environment/registry
+
+        host = _PUSHOVER_URL_PARTS.hostname
+        proxy = urllib.request.getproxies().get("https")
+        if not proxy or urllib.request.proxy_bypass(host):
+            return http.client.HTTPSConnection(host, timeout=10)
+
+        p = urllib.parse.urlsplit(proxy if "://" in proxy else "http://" + proxy)
+        headers = {}
+        if p.username:
+            cred = urllib.parse.unquote(p.username) + ":" + urllib.parse.unquote(p.password or "")
+            headers["Proxy-Authorization"] = "Basic " + base64.b64encode(cred.encode("utf-8")).decode("ascii")
+        conn = http.client.HTTPSConnection(p.hostname, p.port or (443 if p.scheme == "https" else 80), timeout=10)
+        conn.set_tunnel(host, _PUSHOVER_URL_PARTS.port or 443, headers=headers)
+        return conn
+
+    def _pushover_post_once(self, data: bytes) -> tuple[int, bytes]:
+        conn = self._po_conn
+        if conn is None:
+            conn = self._po_conn = self._new_pushover_conn()
+        try:
+            conn.request("POST", _PUSHOVER_URL_PARTS.path, body=data, headers=_FORM_HEADERS)
+            resp = conn.getresponse()
+            return resp.status, resp.read()  # always drain so the connection can be reused
+        except Exception:
+            conn.close()
+            self._po_conn = None
+            raise
+
     def _pushover_request_sync(
         self,
         app_token: str,
@@ -1605,39 +2379,30 @@ class TalkAlertApp(tb.Window):
         if not (app_token and user_key):
             return False, "PushoverのApp Token / User Key が未設定です。"
 
-        params = {
-            "token": app_token,
-            "user": user_key,
-            "title": title,
-            "message": message,
-        }
-        if url:
-            params["url"] = url
-            params["url_title"] = url_title
-
-        # Optional sound (Pushover built-in sound name)
-        if sound:
-            params["sound"] = sound
-
-        data = urllib.parse.urlencode(params).encode("utf-8")
-        req = urllib.request.Request(PUSHOVER_API_URL, data=data, method="POST")
+        data = self._pushover_body(app_token, user_key, title, message, url=url, url_title=url_title, sound=sound)
         try:
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                body = resp.read().decode("utf-8", "replace")
-                if getattr(resp, "status", 200) != 200:
-                    return False, f"HTTP {getattr(resp, 'status', '?')}: {body}"
+            if not self._po_session_checked:
+                self._po_session = self._new_pushover_session()
+                self._po_session_checked = True
+            session = self._po_session
+            if session is not None:
+                resp = session.post(PUSHOVER_API_URL, data=data, headers=_FORM_HEADERS, timeout=10)
+                status, raw = resp.status_code, resp.content
+            else:
+                status, raw = self._pushover_post_conn(data)
         except Exception as e:
             return False, str(e)
 
+        # 200 means accepted; the body is only decoded to explain a failure.
+        if status == 200:
+            return True, ""
+        body = raw.decode("utf-8", "replace")
         try:
             j = json.loads(body)
-            if int(j.get("status", 0)) == 1:
-                return True, ""
             errs = j.get("errors") or j.get("error") or body
-            return False, str(errs)
+            return False, f"HTTP {status}: {errs}"
         except Exception:
-            # if response isn't json
-            return True, ""
+            return False, f"HTTP {status}: {body}"
 
     def _pushover_send_sync(
         self,
@@ -1657,29 +2422,50 @@ class TalkAlertApp(tb.Window):
             sound=sound,
         )
 
-    async def _pushover_send_async(
-        self,
-        title: str,
-        message: str,
-        url: Optional[str] = None,
-        url_title: str = "Open in Discord",
-        sound: str = "",
-    ) -> tuple[bool, str]:
-        return await asyncio.to_thread(self._pushover_send_sync, title, message, url, url_title, sound)
+    def _pushover_enqueue(self, title: str, message: str, url: Optional[str] = None, sound: str = ""):
+        """Queue a push for the background sender (never blocks the Discord event loop)."""
+        try:
+            self._po_queue.put_nowait((title, message, url, sound))
+        except queue.Full:
+            pass  # sender is far behind (network down?) -> drop rather than pile up
+
+    def _ensure_pushover_worker(self):
+        t = self._po_worker
+        if t and t.is_alive():
+            return
+        self._po_worker = threading.Thread(target=self._pushover_worker, daemon=True)
+        self._po_worker.start()
+
+    def _pushover_worker(self):
+        # Single sender thread: pushes go out in order over the kept-alive connection.
+        while True:
+            item = self._po_queue.get()
+            if item is None or self.stop_event.is_set():
+                return
+            title, message, url, sound = item
+            try:
+                self._pushover_send_sync(title, message, url=url, sound=sound)
+            except Exception:
+                pass
 
 
 # ------------------------------------------------------------
     # Bot status indicator (blink dot only; no layout shift)
     # ------------------------------------------------------------
     def _set_dot_color(self, color: str):
+        if color == self._dot_color:
+            return  # skip the Tcl round-trip when nothing changes
         try:
             self.dot_canvas.itemconfigure(self._dot_id, fill=color)
+            self._dot_color = color
         except Exception:
             pass
 
     def _set_bot_state(self, state: str, text: str):
         self._bot_state = state
-        self.status_var.set(text)
+        if text != self._status_text:  # e.g. on_resumed repeats on_ready's text
+            self.status_var.set(text)
+            self._status_text = text
 
         if state == "online":
             self._set_dot_color("#2ecc71")
@@ -1688,33 +2474,129 @@ class TalkAlertApp(tb.Window):
         else:
             self._set_dot_color("#e74c3c")
 
+        # Blink only while connecting; online/offline are steady, so no timer runs in either.
+        if state == "connecting":
+            if self._blink_after_id is None:
+                self._schedule_blink()
+        elif self._blink_after_id is not None:
+            self._after_cancel(self._blink_after_id)
+            self._blink_after_id = None
+
+    def _schedule_blink(self):
+        try:
+            self._blink_after_id = self._after(450, self._tick_blink)
+        except Exception:
+            self._blink_after_id = None
+
     def _tick_blink(self):
+        self._blink_after_id = None
+        if self._bot_state != "connecting":
+            return  # _set_bot_state already drew the steady color
+
         try:
-            if self._bot_state in ("connecting", "offline"):
-                self._blink_on = not self._blink_on
-                if self._bot_state == "connecting":
-                    self._set_dot_color("#2ecc71" if self._blink_on else self.style.colors.bg)
-                else:
-                    self._set_dot_color("#e74c3c" if self._blink_on else self.style.colors.bg)
-            else:
-                self._set_dot_color("#2ecc71")
+            self._blink_on = not self._blink_on
+            self._set_dot_color("#2ecc71" if self._blink_on else self.style.colors.bg)
         except Exception:
             pass
 
-        aid = self.after(450, self._tick_blink)
+        self._schedule_blink()
+
+    def _after(self, ms: int, fn):
+        """self.after() tracked in _after_ids until it fires, so _cleanup can cancel it."""
+        def run():
+            self._after_ids.discard(aid)
+            fn()
+        aid = self.after(ms, run)
         self._after_ids.add(aid)
+        return aid
+
+    def _after_idle(self, fn):
+        def run():
+            self._after_ids.discard(aid)
+            fn()
+        aid = self.after_idle(run)
+        self._after_ids.add(aid)
+        return aid
+
+    def _after_cancel(self, aid):
+        if aid is None or aid not in self._after_ids:
+            return
+        self._after_ids.discard(aid)
+        try:
+            self.after_cancel(aid)
+        except tk.TclError:
+            pass
 
     def _cancel_afters(self):
+        # Cancel everything still pending before destroy(), so no callback runs against
+        # already-destroyed widgets ("invalid command name" errors at exit).
         for aid in list(self._after_ids):
             try:
                 self.after_cancel(aid)
-            except Exception:
+            except tk.TclError:
                 pass
         self._after_ids.clear()
+        # the single-purpose handles all pointed into the set; none of them is pending any more
+        self._save_after_id = self._blink_after_id = self._volume_after_id = self._unmap_after_id = None
+        self._refresh_pending = False
+
     def _confirm_exit(self):
         # Single confirmation dialog is handled in on_close().
         self.on_close()
 
+    def _build_exit_dialog(self):
+        """Exit confirmation, built once and withdrawn between uses."""
+        dlg = tb.Toplevel(self)
+        dlg.withdraw()
+        dlg.title(APP_NAME)
+        dlg.resizable(False, False)
+        var = tk.IntVar(value=0)
+
+        def answer(v: int):
+            dlg.grab_release()
+            dlg.withdraw()
+            var.set(v)
+
+        frame = tb.Frame(dlg, padding=16)
+        frame.pack(fill=BOTH, expand=YES)
+        tb.Label(frame, text="監視を終了してアプリを終了しますか？").pack(anchor="w")
+        btns = tb.Frame(frame)
+        btns.pack(fill=X, pady=(14, 0))
+        yes = tb.Button(btns, text="はい", command=lambda: answer(1), bootstyle="danger", width=10)
+        yes.pack(side=RIGHT)
+        tb.Button(btns, text="いいえ", command=lambda: answer(0), bootstyle="secondary", width=10).pack(side=RIGHT, padx=(0, 10))
+        dlg.protocol("WM_DELETE_WINDOW", lambda: answer(0))
+        dlg.bind("<Return>", lambda _e: answer(1))
+        dlg.bind("<Escape>", lambda _e: answer(0))
+
+        self._exit_dlg, self._exit_var, self._exit_yes_btn = dlg, var, yes
+
+    def _ask_exit(self) -> bool:
+        # wait_variable keeps the main loop (after() timers, tray callbacks) running
+        # while the question is open, unlike messagebox's native modal loop.
+        if self._exit_dlg is None:
+            self._build_exit_dialog()
+        dlg, var = self._exit_dlg, self._exit_var
+        var.set(-1)
+        dlg.transient(self)
+        self._center_over_self(dlg)
+        dlg.deiconify()
+        dlg.lift()
+        dlg.grab_set()
+        self._exit_yes_btn.focus_set()
+        self.wait_variable(var)
+        return var.get() == 1
+
+    def _center_over_self(self, win):
+        """Position a withdrawn Toplevel over the main window (kept on screen), like messagebox does."""
+        self.update_idletasks()  # current main-window geometry and the dialog's requested size
+        w, h = win.winfo_reqwidth(), win.winfo_reqheight()
+        x = self.winfo_rootx() + (self.winfo_width() - w) // 2
+        y = self.winfo_rooty() + (self.winfo_height() - h) // 2
+        x = max(0, min(x, self.winfo_screenwidth() - w))
+        y = max(0, min(y, self.winfo_screenheight() - h))
+        win.geometry(f"+{x}+{y}")
+
 
 
     # ------------------------------------------------------------
@@ -1722,68 +2604,123 @@ class TalkAlertApp(tb.Window):
     # ------------------------------------------------------------
     def _cleanup(self):
         self.stop_event.set()
+        try:
+            self._po_queue.put_nowait(None)  # wake the Pushover sender so it exits
+        except queue.Full:
+            pass
+        self._play_queue.put(None)  # and the audio worker
         self._cancel_afters()
-        self._save_config()
+        self._write_config(sync=True)
+        try:
+            self._cfg_queue.put_nowait(None)  # stop the writer thread
+        except queue.Full:
+            pass
 
         # tray icon
         try:
-            self._stop_tray()
+            self._stop_tray(join=False)
         except Exception:
             pass
 
         try:
             if self._audio_ready:
-                pygame.mixer.music.stop()
-                pygame.mixer.quit()
+                self._stop_sound()
+                # no worker load or bot-thread play can run on a closed mixer
+                with self._music_lock, self._audio_lock:
+                    self._audio_ready = False
+                    self._sound_cache.clear()
+                    pygame.mixer.quit()
         except Exception:
             pass
 
+        # Don't block Tk teardown on the Discord close handshake; the daemon thread
+        # finishes it in the background (or dies with the process).
         try:
-            self._stop_bot()
+            fut = self._signal_bot_stop()
+            threading.Thread(target=self._join_bot, args=(fut,), daemon=True).start()
         except Exception:
             pass
 
+    def _raise_for_dialog(self):
+        """Bring the main window up with only the WM calls its current state needs."""
+        st = self.state()
+        if st == "iconic":
+            self.deiconify()
+        if st != "normal" and st != "zoomed":
+            self.state("normal")
+        self.lift()
+        self.focus_force()
+
     def on_close(self):
         # Click [X] -> confirm to stop monitoring and exit
+        # [X], Esc and tray "Quit" all land here; ignore them while a close is already in progress.
+        if self._shutting_down:
+            return
+        self._shutting_down = True
         was_in_tray = bool(getattr(self, "_in_tray", False))
 
         # Ensure dialog appears
-        try:
-            if was_in_tray:
-                self._show_from_tray()
-            else:
-                if self.state() == "iconic":
-                    self.deiconify()
-                    self.state("normal")
-                self.lift()
-                self.focus_force()
-        except Exception:
-            pass
+        if was_in_tray:
+            self._show_from_tray()
+        else:
+            try:
+                self._raise_for_dialog()
+            except tk.TclError:
+                pass
 
-        if not messagebox.askyesno(APP_NAME, "監視を終了してアプリを終了しますか？"):
+        if not self._ask_exit():
+            self._shutting_down = False
             # If it was in tray, return to tray
             if was_in_tray:
                 try:
-                    self.after(0, self._hide_to_tray)
-                except Exception:
+                    self._after(0, self._hide_to_tray)
+                except (RuntimeError, tk.TclError):  # loop already stopping
                     pass
             return
 
+        # Hide first so the window is gone the moment the user confirms; the config flush, mixer
+        # shutdown and widget teardown in __exit__ then happen out of sight.
+        try:
+            self.withdraw()
+        except tk.TclError:
+            pass
+        # leave mainloop; __exit__ does the cleanup and teardown
+        self.quit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        # Runs for a normal close and for any exception out of mainloop alike.
         try:
             self._cleanup()
         finally:
             try:
-                self.quit()
-            except Exception:
+                self.destroy()
+            except tk.TclError:
                 pass
+        return False
+
+
+def _exit_if_threads_linger(timeout: float = 2.0):
+    """Last resort after teardown. pystray's run_detached() starts non-daemon threads, so if
+    icon.stop() lost a race with the tray loop they would keep the process alive with no window."""
+    deadline = time.monotonic() + timeout
+    main = threading.main_thread()
+    for t in threading.enumerate():
+        if t is main or t.daemon:
+            continue
+        t.join(max(0.0, deadline - time.monotonic()))
+    if any(t is not main and not t.daemon and t.is_alive() for t in threading.enumerate()):
+        for stream in (sys.stdout, sys.stderr):
             try:
-                self.destroy()
+                stream.flush()
             except Exception:
                 pass
-            if FORCE_EXIT:
-                os._exit(0)
-
+        os._exit(0)
 
 
 if __name__ == "__main__":
-    TalkAlertApp().mainloop()
+    with TalkAlertApp() as app:
+        app.mainloop()
+    _exit_if_threads_linger()